@@ -5,12 +5,14 @@ This Flask application provides REST endpoints for running Monte Carlo
 simulations and analyzing estimator accuracy.
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
 from flask_cors import CORS
 import time
 import numpy as np
+import orjson
 from src.simulation import (
     run_monte_carlo_simulation,
+    run_accuracy_sweep,
     calculate_rmse,
     calculate_bias,
     calculate_variance
@@ -20,9 +22,35 @@ from src.bayesian import (
     calculate_credible_interval,
     run_bayesian_simulation
 )
+from src.simulation import _make_rng
 
 app = Flask(__name__)
 
+# Module-level PCG64 generator for ad-hoc sampling in request handlers,
+# seeded per process so forked Gunicorn workers are uncorrelated
+_rng = _make_rng()
+
+
+def reseed_rng() -> None:
+    """Re-seed the module RNG; call from a Gunicorn post_fork hook."""
+    global _rng
+    _rng = _make_rng()
+
+
+def _json_response(payload: dict) -> Response:
+    """
+    Serialize a response payload with orjson.
+
+    orjson encodes NumPy arrays directly in C (OPT_SERIALIZE_NUMPY), so
+    handlers can put ndarrays straight into the payload instead of
+    round-tripping through ndarray.tolist() and the stdlib json encoder.
+    """
+    return Response(
+        orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY),
+        mimetype='application/json'
+    )
+
+
 # Configure CORS for React frontend
 # Allow requests from local development and production (Render, Vercel, etc.)
 # Apply CORS globally to handle preflight requests correctly
@@ -45,15 +73,21 @@ def simulate():
     Expected JSON payload:
     {
         "true_population": int (N),
-        "sample_size": int (k)
+        "sample_size": int (k),
+        "include_samples": bool,  # optional, default true; false returns
+                                  # only the summary statistics
+        "histogram_bins": int     # optional; when set, returns binned
+                                  # counts instead of the raw estimates
     }
 
     Returns:
     {
         "true_population": int,
         "sample_size": int,
-        "naive_estimates": [int, ...],  # 10,000 estimates
-        "mvue_estimates": [int, ...],   # 10,000 estimates
+        "naive_estimates": [int, ...],  # 10,000 estimates (when requested)
+        "mvue_estimates": [int, ...],   # 10,000 estimates (when requested)
+        "naive_histogram": {"counts": [...], "bin_edges": [...]},  # with histogram_bins
+        "mvue_histogram": {"counts": [...], "bin_edges": [...]},   # with histogram_bins
         "naive_rmse": float,
         "mvue_rmse": float,
         "naive_bias": float,
@@ -72,6 +106,8 @@ def simulate():
         data = request.get_json()
         true_population = int(data['true_population'])
         sample_size = int(data['sample_size'])
+        include_samples = bool(data.get('include_samples', True))
+        histogram_bins = data.get('histogram_bins')
 
         # Validate inputs
         if sample_size >= true_population:
@@ -94,6 +130,13 @@ def simulate():
                 'error': 'True population must be at most 100,000'
             }), 400
 
+        if histogram_bins is not None:
+            histogram_bins = int(histogram_bins)
+            if histogram_bins < 1 or histogram_bins > 500:
+                return jsonify({
+                    'error': 'Histogram bins must be between 1 and 500'
+                }), 400
+
         # Run simulation
         start_time = time.time()
         naive_estimates, mvue_estimates = run_monte_carlo_simulation(
@@ -109,11 +152,9 @@ def simulate():
         naive_bias = calculate_bias(naive_estimates, true_population)
         mvue_bias = calculate_bias(mvue_estimates, true_population)
 
-        return jsonify({
+        payload = {
             'true_population': true_population,
             'sample_size': sample_size,
-            'naive_estimates': naive_estimates.tolist(),
-            'mvue_estimates': mvue_estimates.tolist(),
             'naive_rmse': round(naive_rmse, 2),
             'mvue_rmse': round(mvue_rmse, 2),
             'naive_bias': round(naive_bias, 2),
@@ -122,7 +163,31 @@ def simulate():
                 'iterations': 10000,
                 'computation_time_ms': round(computation_time, 2)
             }
-        })
+        }
+
+        # Binned counts are ~2 KB vs ~200 KB for the raw estimate
+        # arrays; clients that only plot a histogram or the summary
+        # tiles can skip the bulk of the payload
+        if histogram_bins is not None:
+            naive_counts, naive_edges = np.histogram(
+                naive_estimates, bins=histogram_bins
+            )
+            mvue_counts, mvue_edges = np.histogram(
+                mvue_estimates, bins=histogram_bins
+            )
+            payload['naive_histogram'] = {
+                'counts': naive_counts,
+                'bin_edges': naive_edges
+            }
+            payload['mvue_histogram'] = {
+                'counts': mvue_counts,
+                'bin_edges': mvue_edges
+            }
+        elif include_samples:
+            payload['naive_estimates'] = naive_estimates
+            payload['mvue_estimates'] = mvue_estimates
+
+        return _json_response(payload)
 
     except KeyError as e:
         return jsonify({
@@ -190,24 +255,26 @@ def accuracy():
                     'error': f'Sample size {sample_size} must be at least 2'
                 }), 400
 
-        results = []
-        for sample_size in sample_sizes:
-            naive_estimates, mvue_estimates = run_monte_carlo_simulation(
-                true_population,
-                sample_size,
-                num_simulations=10000
-            )
-
-            naive_rmse = calculate_rmse(naive_estimates, true_population)
-            mvue_rmse = calculate_rmse(mvue_estimates, true_population)
+        # The whole sweep collapses into one broadcast draw - one column
+        # per sample size - so there is no Python-level loop (and no
+        # process pool) over the requested k values
+        naive_rmses, mvue_rmses = run_accuracy_sweep(
+            true_population,
+            tuple(sample_sizes),
+            num_simulations=10000
+        )
 
+        results = []
+        for sample_size, naive_rmse, mvue_rmse in zip(
+            sample_sizes, naive_rmses, mvue_rmses
+        ):
             results.append({
                 'sample_size': sample_size,
-                'naive_rmse': round(naive_rmse, 2),
-                'mvue_rmse': round(mvue_rmse, 2)
+                'naive_rmse': round(float(naive_rmse), 2),
+                'mvue_rmse': round(float(mvue_rmse), 2)
             })
 
-        return jsonify({
+        return _json_response({
             'true_population': true_population,
             'results': results
         })
@@ -300,13 +367,16 @@ def bayesian():
                     'error': 'Max observed must be at least 1'
                 }), 400
         else:
-            # Simulate a random observation
-            sample = np.random.choice(
-                np.arange(1, true_population + 1),
+            # Simulate a random observation. Passing the population size
+            # directly lets the Generator sample 0..N-1 without the
+            # caller materializing an N-element arange (800 KB at the
+            # N=100k ceiling); shift by 1 for serial numbers 1..N
+            sample = _rng.choice(
+                true_population,
                 size=sample_size,
                 replace=False
             )
-            max_observed = int(np.max(sample))
+            max_observed = int(np.max(sample)) + 1
 
         # Calculate posterior distribution
         start_time = time.time()
@@ -325,12 +395,12 @@ def bayesian():
             confidence=0.95
         )
 
-        return jsonify({
+        return _json_response({
             'true_population': true_population,
             'sample_size': sample_size,
             'max_observed': max_observed,
-            'n_values': grid_points.tolist(),
-            'posterior': posterior.tolist(),
+            'n_values': grid_points,
+            'posterior': posterior,
             'map_estimate': round(map_estimate, 2),
             'mean_estimate': round(mean_estimate, 2),
             'std_estimate': round(std_estimate, 2),
@@ -0,0 +1,29 @@
+"""
+Gunicorn configuration tuned for the NumPy-heavy simulation workload.
+
+The hot paths spend most of their time inside NumPy C code, which
+releases the GIL for any non-trivial array, so threaded workers scale
+across concurrent requests without extra processes. preload_app imports
+the app (and the pre-warmed posterior weight tables) once in the parent
+so forked workers share them copy-on-write.
+"""
+
+import os
+
+bind = '0.0.0.0:' + os.environ.get('PORT', '5000')
+
+worker_class = 'gthread'
+workers = os.cpu_count()
+threads = 4
+preload_app = True
+
+
+def post_fork(server, worker):
+    """Re-seed each worker's RNGs so preloaded state is not replayed."""
+    from app import reseed_rng as reseed_app
+    from src.simulation import reseed_rng as reseed_simulation
+    from src.bayesian import reseed_rng as reseed_bayesian
+
+    reseed_app()
+    reseed_simulation()
+    reseed_bayesian()
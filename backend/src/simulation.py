@@ -5,11 +5,38 @@ This module uses vectorized NumPy operations to efficiently run thousands
 of simulations, comparing naive vs MVUE estimators.
 """
 
+import os
+
 import numpy as np
-from typing import Tuple
+from typing import Dict, Tuple
 from .estimators import naive_estimator, mvue_estimator
 
 
+def _make_rng() -> np.random.Generator:
+    """
+    Build the module-level PCG64 generator.
+
+    Seeded from the PID mixed with OS entropy so that Gunicorn workers
+    forked from a preloaded parent do not inherit identical RNG state
+    and produce correlated simulations.
+    """
+    seed = np.random.SeedSequence(
+        os.getpid() ^ int.from_bytes(os.urandom(4), 'little')
+    )
+    return np.random.Generator(np.random.PCG64(seed))
+
+
+# Module-level PCG64 generator (faster than the legacy MT19937 global state,
+# and avoids re-creating a Generator on every request)
+_RNG = _make_rng()
+
+
+def reseed_rng() -> None:
+    """Re-seed the module RNG; call from a Gunicorn post_fork hook."""
+    global _RNG
+    _RNG = _make_rng()
+
+
 def run_monte_carlo_simulation(
     true_population: int,
     sample_size: int,
@@ -19,7 +46,10 @@ def run_monte_carlo_simulation(
     Run Monte Carlo simulation using vectorized NumPy operations.
 
     Key performance optimizations:
-    - np.random.choice for efficient random sampling
+    - Inverse-CDF sampling of the sample maximum: the max of k uniform
+      draws from {1..N} has CDF (m/N)^k, so m = ceil(N * U^(1/k)) with
+      U ~ Uniform(0,1). One float draw per simulation replaces the full
+      (num_simulations x sample_size) sample matrix.
     - Vectorized operations across all simulations simultaneously
     - No Python loops - all computation in NumPy
 
@@ -39,31 +69,113 @@ def run_monte_carlo_simulation(
         Naive mean: 950.2, MVUE mean: 999.8
 
     Performance:
-        - 10,000 iterations complete in ~100-200ms
-        - Memory usage: ~160KB for 10,000 iterations (2 * 10,000 * 8 bytes)
+        - 10,000 iterations complete in ~1-2ms
+        - Memory usage: ~120KB for 10,000 iterations (3 arrays of 10,000)
     """
-    # Generate all samples at once using NumPy broadcasting
-    # Shape: (num_simulations, sample_size)
-    # Each row is one simulation with k randomly selected serial numbers
-    samples = np.random.choice(
-        np.arange(1, true_population + 1),
-        size=(num_simulations, sample_size),
-        replace=True
-    )
-
-    # Find maximum serial number in each sample
-    # Shape: (num_simulations,)
-    max_serials = np.max(samples, axis=1)
+    # Draw only the sample maximum for each simulation via the inverse CDF:
+    # max of k uniform draws from {1..N} is distributed as ceil(N * U^(1/k)).
+    # This collapses memory from O(num_simulations * sample_size) to
+    # O(num_simulations) and skips the row-wise max reduction entirely.
+    # random() is [0, 1), so flip to (0, 1]: u = 0 would yield the
+    # impossible serial number 0. Shape: (num_simulations,)
+    u = 1.0 - _RNG.random(num_simulations)
+    max_serials = np.ceil(
+        true_population * u ** (1.0 / sample_size)
+    ).astype(np.int32)
 
     # Calculate naive estimates (vectorized)
     # Naive: N_hat = m
     naive_estimates = max_serials
 
     # Calculate MVUE estimates (vectorized)
-    # MVUE: N_hat = m * (1 + 1/k) - 1
-    mvue_estimates = max_serials * (1 + 1 / sample_size) - 1
+    # MVUE: N_hat = m * (1 + 1/k) - 1, computed in integer math as
+    # m * (k + 1) // k - 1 to avoid promoting the array to float64.
+    # The int64 widen guards the m * (k + 1) product against int32
+    # overflow at the large end of the parameter range (N up to 100k)
+    mvue_estimates = (
+        max_serials.astype(np.int64) * (sample_size + 1) // sample_size - 1
+    )
+
+    return naive_estimates, mvue_estimates
 
-    return naive_estimates.astype(int), mvue_estimates.astype(int)
+
+# Memoized (naive_rmse, mvue_rmse) per (N, k, num_simulations) for the
+# accuracy sweep. The same sample sizes recur every time the UI redraws
+# the accuracy chart, and the aggregates are statistically identical
+# across requests, so recomputing them is pure waste. A plain dict
+# (FIFO-bounded) instead of lru_cache so that a sweep can probe for its
+# cache misses and batch them into a single broadcast draw.
+_ACCURACY_CACHE: Dict[Tuple[int, int, int], Tuple[float, float]] = {}
+_ACCURACY_CACHE_MAX = 4096
+
+
+def run_accuracy_sweep(
+    true_population: int,
+    sample_sizes: Tuple[int, ...],
+    num_simulations: int = 10000
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute naive and MVUE RMSE for several sample sizes in one draw.
+
+    Each column of a single (num_simulations x len(sample_sizes)) uniform
+    matrix is transformed through the inverse CDF with its own k
+    (U^(1/k) ~ Beta(k, 1)), so the whole sweep needs one RNG call and no
+    Python-level loop over sample sizes. The scalar RMSE pair for each
+    (N, k) is memoized, so only previously unseen sample sizes are drawn.
+
+    Args:
+        true_population: N (actual number of tanks)
+        sample_sizes: Sequence of k values to evaluate
+        num_simulations: Number of Monte Carlo iterations per k
+
+    Returns:
+        Tuple of (naive_rmse, mvue_rmse) arrays, one entry per sample
+        size in input order
+
+    Example:
+        >>> naive_rmse, mvue_rmse = run_accuracy_sweep(1000, (5, 10, 20))
+        >>> print(naive_rmse.round(1), mvue_rmse.round(1))
+        [218.4 123.1  66.6] [169.2  92.1  47.5]
+    """
+    missing = [
+        int(k) for k in sample_sizes
+        if (true_population, int(k), num_simulations) not in _ACCURACY_CACHE
+    ]
+
+    if missing:
+        ks = np.asarray(missing, dtype=np.float64)
+
+        # One uniform per (simulation, sample size); columnwise inverse
+        # CDF, flipped to (0, 1] so the transform can never emit 0
+        u = 1.0 - _RNG.random((num_simulations, ks.size))
+        max_serials = np.ceil(true_population * u ** (1.0 / ks))
+
+        # MVUE: floor(m * (k + 1) / k) - 1, matching the integer form in
+        # run_monte_carlo_simulation
+        mvue_estimates = np.floor(max_serials * (ks + 1) / ks) - 1
+
+        naive_rmse = np.sqrt(
+            ((max_serials - true_population) ** 2).mean(axis=0)
+        )
+        mvue_rmse = np.sqrt(
+            ((mvue_estimates - true_population) ** 2).mean(axis=0)
+        )
+
+        for k, naive, mvue in zip(missing, naive_rmse, mvue_rmse):
+            _ACCURACY_CACHE[(true_population, k, num_simulations)] = (
+                float(naive), float(mvue)
+            )
+        while len(_ACCURACY_CACHE) > _ACCURACY_CACHE_MAX:
+            _ACCURACY_CACHE.pop(next(iter(_ACCURACY_CACHE)))
+
+    pairs = [
+        _ACCURACY_CACHE[(true_population, int(k), num_simulations)]
+        for k in sample_sizes
+    ]
+    if not pairs:
+        return np.array([]), np.array([])
+    naive_rmses, mvue_rmses = zip(*pairs)
+    return np.array(naive_rmses), np.array(mvue_rmses)
 
 
 def calculate_rmse(estimates: np.ndarray, true_value: int) -> float:
@@ -88,8 +200,10 @@ def calculate_rmse(estimates: np.ndarray, true_value: int) -> float:
         >>> calculate_rmse(estimates, 1000)
         40.825  # sqrt(((950-1000)^2 + (1000-1000)^2 + (1050-1000)^2) / 3)
     """
-    squared_errors = (estimates - true_value) ** 2
-    mean_squared_error = np.mean(squared_errors)
+    # Square in float64: int32 estimate arrays would overflow on the
+    # squared errors at the top of the parameter range
+    errors = np.asarray(estimates, dtype=np.float64) - true_value
+    mean_squared_error = np.mean(errors ** 2)
     return float(np.sqrt(mean_squared_error))
 
 
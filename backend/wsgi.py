@@ -0,0 +1,12 @@
+"""
+WSGI entry point for the German Tank Problem backend.
+
+Run with Gunicorn (see gunicorn.conf.py for the tuned defaults):
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+"""
+
+from app import app
+
+if __name__ == '__main__':
+    app.run(host='0.0.0.0', port=5000)